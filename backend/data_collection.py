@@ -3,10 +3,13 @@ import httpx
 from dotenv import load_dotenv
 import asyncio
 from typing import List
-from bs4 import BeautifulSoup
+from query_planner import plan_queries, match_keywords, merge_results, keyword_coverage, select_articles
 
 load_dotenv()
 
+# Number of articles scraped and passed on to the report
+MAX_ARTICLES = 7
+
 class TechArticleSearch:
     def __init__(self):
         self.api_key = os.getenv("SERPER_API_KEY")
@@ -20,6 +23,7 @@ class TechArticleSearch:
 
     async def _scrape_content(self, article: dict) -> dict:
         """Asynchronously scrapes content from a single article URL using a browser-like header."""
+        from bs4 import BeautifulSoup
         print(f"  -> Scraping: {article.get('link')}")
         async with httpx.AsyncClient(headers=self.scraping_headers, follow_redirects=True, timeout=20.0) as client:
             try:
@@ -53,29 +57,34 @@ class TechArticleSearch:
             print(f"❌ API search for query '{query}' failed: {e}")
             return []
 
+    async def _run_planned_query(self, plan: dict, date_filter: str) -> list:
+        """
+        Runs one combined query and tags each result with the keywords it matched.
+        Only the first page is requested: its 10 results already exceed MAX_ARTICLES.
+        """
+        results = await self._search_and_scrape_single_query(plan['query'], date_filter)
+        for article in results:
+            article['matched_keywords'] = match_keywords(article, plan['keywords'])
+        return results
+
     async def run_fed_landscape_search(self, selected_keywords: List[str], date_filter: str = "w") -> list:
         if not selected_keywords:
             return []
 
-        search_queries = []
-        for keyword in selected_keywords:
-            query = (
-                f'"{keyword}" AND '
-                f'("university research funding" OR "federal grant" OR "innovation ecosystem" OR "R&D policy") AND '
-                f'(site:.gov OR site:.edu OR site:.org) -jobs -admissions -curriculum'
-            )
-            search_queries.append(query)
-        
-        tasks = [self._search_and_scrape_single_query(q, date_filter) for q in search_queries]
+        planned_queries = plan_queries(selected_keywords)
+        print(f"🧭 Planned {len(planned_queries)} search queries for {len(selected_keywords)} keywords.")
+
+        tasks = [self._run_planned_query(plan, date_filter) for plan in planned_queries]
         results_from_all_searches = await asyncio.gather(*tasks)
 
-        combined_articles = {}
-        for result_list in results_from_all_searches:
-            for article in result_list:
-                if article.get('link') and article['link'] not in combined_articles:
-                    combined_articles[article['link']] = article
-        
-        unique_articles = list(combined_articles.values())[:7]
+        results_per_query = merge_results(results_from_all_searches)
+
+        planned_keywords = [kw for plan in planned_queries for kw in plan['keywords']]
+        coverage = keyword_coverage(results_per_query, planned_keywords)
+        print(f"📊 Results per keyword: {coverage['keywords']} (unattributed: {coverage['unattributed']})")
+
+        # Spread the scraped articles across queries instead of letting the first one fill every slot
+        unique_articles = select_articles(results_per_query, MAX_ARTICLES)
         print(f"Found {len(unique_articles)} unique articles to scrape.")
         
         if not unique_articles:
@@ -0,0 +1,87 @@
+import os
+import asyncio
+import threading
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class Dependencies:
+    """
+    Lazily builds the backend's service clients on first use so that importing
+    the app (workers, tests, CLI tools) is fast and does not require secrets.
+    """
+    def __init__(self):
+        # One lock per client, so building a slow client (openai, arcadepy) in the
+        # warm-up thread never blocks the event loop waiting on an unrelated one
+        self._locks = {name: threading.Lock() for name in ("report_generator", "searcher", "classifier", "arcade")}
+        self._report_generator = None
+        self._searcher = None
+        self._classifier = None
+        self._arcade = None
+        self.ready = False
+        self.warmup_failed = False
+
+    @property
+    def report_generator(self):
+        if self._report_generator is None:
+            with self._locks["report_generator"]:
+                if self._report_generator is None:
+                    from llm_generator import ReportGenerator
+                    self._report_generator = ReportGenerator()
+        return self._report_generator
+
+    @property
+    def searcher(self):
+        if self._searcher is None:
+            with self._locks["searcher"]:
+                if self._searcher is None:
+                    from data_collection import TechArticleSearch
+                    self._searcher = TechArticleSearch()
+        return self._searcher
+
+    @property
+    def classifier(self):
+        if self._classifier is None:
+            with self._locks["classifier"]:
+                if self._classifier is None:
+                    from classifier import ContentClassifier
+                    self._classifier = ContentClassifier()
+        return self._classifier
+
+    @property
+    def arcade(self):
+        if self._arcade is None:
+            with self._locks["arcade"]:
+                if self._arcade is None:
+                    api_key = os.getenv("ARCADE_API_KEY")
+                    if not all([api_key, os.getenv("ARCADE_USER_ID")]):
+                        raise ValueError("ARCADE_API_KEY and ARCADE_USER_ID must be set in the .env file.")
+                    from arcadepy import Arcade
+                    self._arcade = Arcade(api_key=api_key)
+        return self._arcade
+
+    def warm_up(self):
+        """
+        Builds every client up front, recording (not raising) any failure.
+        The HTTP clients open a connection per call, so there is no pool to
+        fill; the deferred scraping import is loaded here instead.
+        """
+        try:
+            import bs4
+            self.report_generator
+            self.searcher
+            self.classifier
+            self.arcade
+            self.warmup_failed = False
+            print("✅ Backend dependencies warmed up.")
+        except Exception as e:
+            self.warmup_failed = True
+            print(f"❌ Error while warming up dependencies: {e}")
+        finally:
+            self.ready = True
+
+    async def warm_up_in_background(self):
+        """Runs warm_up in a worker thread so the event loop keeps serving requests."""
+        await asyncio.to_thread(self.warm_up)
+
+container = Dependencies()
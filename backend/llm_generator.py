@@ -1,5 +1,4 @@
 import os
-from openai import OpenAI, APIError
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -14,6 +13,8 @@ class ReportGenerator:
             print("⚠️ OpenAI API key not found. Summarization will be basic.")
             self.client = None
         else:
+            # Imported here so that loading this module stays cheap until a client is needed
+            from openai import OpenAI
             self.client = OpenAI(api_key=api_key)
             print("✅ Report Generator configured to use OpenAI GPT-4o.")
 
@@ -56,6 +57,7 @@ class ReportGenerator:
         
         user_prompt = f"Please create a 1-2 sentence paragraph summary for the following article:\n\n---\n\n{article_content}"
 
+        from openai import APIError
         try:
             response = self.client.chat.completions.create(
                 model="gpt-4o",
@@ -90,6 +92,7 @@ class ReportGenerator:
         
         user_prompt = f"Please create a 5-point bulleted summary for the following article:\n\n---\n\n{article_content}"
 
+        from openai import APIError
         try:
             response = self.client.chat.completions.create(
                 model="gpt-4o",
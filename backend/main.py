@@ -1,18 +1,28 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from data_collection import TechArticleSearch
-from classifier import ContentClassifier
-from llm_generator import ReportGenerator
 from datetime import datetime
 from typing import List
+from dependencies import container
 import tools
 
 # --- App Setup ---
-app = FastAPI()
-report_generator = ReportGenerator()
-searcher = TechArticleSearch()
-classifier = ContentClassifier()
+# Service clients are built lazily by the dependency container, not at import time.
+# Once the server is up they are warmed in the background, without delaying startup.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warm_up_task = asyncio.create_task(container.warm_up_in_background())
+    yield
+    warm_up_task.cancel()
+    try:
+        await warm_up_task
+    except asyncio.CancelledError:
+        pass
+
+app = FastAPI(lifespan=lifespan)
 
 # Final, robust CORS configuration to prevent connection errors
 origins = ["*"] 
@@ -27,7 +37,7 @@ class ProcessRequest(BaseModel):
 async def generate_and_email_report(keywords: List[str], date_filter: str, email: str):
     try:
         print("🚀 Background task started: Searching for articles...")
-        articles = await searcher.run_fed_landscape_search(keywords, date_filter)
+        articles = await container.searcher.run_fed_landscape_search(keywords, date_filter)
         
         if not articles:
             print("⏹️ Background task finished: No articles found.")
@@ -40,7 +50,7 @@ async def generate_and_email_report(keywords: List[str], date_filter: str, email
             f"affecting universities and innovation ecosystems related to {', '.join(keywords)}."
         )
         for article in articles:
-            article['relevance_score'] = classifier.evaluate_relevance(
+            article['relevance_score'] = container.classifier.evaluate_relevance(
                 article.get('full_content', ''), relevance_context
             )
 
@@ -51,7 +61,7 @@ async def generate_and_email_report(keywords: List[str], date_filter: str, email
         report_content = f"# {report_title}\n\nThis report summarizes recent federal activities.\n\n---\n\n"
         
         for article in sorted_articles[:7]:
-            full_summary = report_generator.generate_full_summary(article.get('full_content', ''))
+            full_summary = container.report_generator.generate_full_summary(article.get('full_content', ''))
             paragraph = full_summary.get('paragraph', 'Summary not available.')
             points = full_summary.get('points', 'Key points not available.')
             
@@ -85,3 +95,12 @@ async def process_request_endpoint(request: ProcessRequest, background_tasks: Ba
         "message": "Report generation started! You will receive an email in a few minutes."
     }
 
+# Readiness probe: healthy only once the background warm-up has completed successfully.
+@app.get("/api/ready")
+async def readiness_endpoint():
+    if not container.ready:
+        return JSONResponse(status_code=503, content={"status": "warming"})
+    if container.warmup_failed:
+        # The cause is logged during warm-up; it may name missing secrets, so it is not exposed here
+        return JSONResponse(status_code=503, content={"status": "error"})
+    return {"status": "ready"}
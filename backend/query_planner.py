@@ -0,0 +1,167 @@
+import re
+from typing import List, Optional
+
+# Shared filter appended to every Fed Landscape search query
+QUERY_SUFFIX = (
+    '("university research funding" OR "federal grant" OR "innovation ecosystem" OR "R&D policy") AND '
+    '(site:.gov OR site:.edu OR site:.org) -jobs -admissions -curriculum'
+)
+
+# Google (and therefore Serper) ignores everything past the 32nd word of a query,
+# so each combined query must fit within this budget, suffix included.
+MAX_QUERY_WORDS = 32
+MAX_QUERY_CHARS = 2048
+
+def _clean_keyword(keyword: str) -> str:
+    return keyword.replace('"', '').strip()
+
+def _count_words(query: str) -> int:
+    return len(re.sub(r'[()"]', ' ', query).split())
+
+def estimate_volume(keyword: str) -> int:
+    """
+    Rough guess of how many results a keyword pulls in: short acronyms (AI, ML)
+    are broadest, single words next, multi-word phrases are the most specific.
+    """
+    if keyword.isupper() and len(keyword) <= 5:
+        return 3
+    if len(keyword.split()) == 1:
+        return 2
+    return 1
+
+def build_query(keywords: List[str]) -> str:
+    """Combines keywords into a single OR query with the shared suffix."""
+    terms = ' OR '.join(f'"{kw}"' for kw in keywords)
+    if len(keywords) > 1:
+        terms = f'({terms})'
+    return f'{terms} AND {QUERY_SUFFIX}'
+
+def _fits(keywords: List[str]) -> bool:
+    query = build_query(keywords)
+    return _count_words(query) <= MAX_QUERY_WORDS and len(query) <= MAX_QUERY_CHARS
+
+def plan_queries(selected_keywords: List[str]) -> List[dict]:
+    """
+    Packs keywords into as few OR-combined queries as the length limits allow,
+    then spreads them so each query carries a similar expected result volume.
+
+    Returns:
+        A list of dictionaries with 'keywords' and 'query' as keys.
+    """
+    keywords = []
+    for keyword in selected_keywords:
+        cleaned = _clean_keyword(keyword)
+        if cleaned and cleaned.lower() not in {kw.lower() for kw in keywords}:
+            keywords.append(cleaned)
+    if not keywords:
+        return []
+
+    bins = _first_fit(keywords)
+    groups = _balance(keywords, len(bins)) or bins
+    return [{"keywords": group, "query": build_query(group)} for group in groups]
+
+def _by_length(keywords: List[str]) -> List[str]:
+    # Longest phrases first (they are hardest to place), broadest first among equals
+    return sorted(keywords, key=lambda kw: (len(kw.split()), estimate_volume(kw)), reverse=True)
+
+def _first_fit(keywords: List[str]) -> List[List[str]]:
+    """Packs keywords into the fewest queries by word count, ignoring volume."""
+    bins: List[List[str]] = []
+    for keyword in _by_length(keywords):
+        for group in bins:
+            if _fits(group + [keyword]):
+                group.append(keyword)
+                break
+        else:
+            bins.append([keyword])
+    return bins
+
+def _balance(keywords: List[str], query_count: int) -> Optional[List[List[str]]]:
+    """
+    Spreads keywords over `query_count` queries, each into the lightest query
+    that still has room. Returns None when they do not all fit, so balancing
+    never costs an extra call.
+    """
+    groups: List[List[str]] = [[] for _ in range(query_count)]
+    volumes = [0] * query_count
+    for keyword in _by_length(keywords):
+        candidates = [i for i, group in enumerate(groups) if _fits(group + [keyword])]
+        if not candidates:
+            return None
+        target = min(candidates, key=lambda i: volumes[i])
+        groups[target].append(keyword)
+        volumes[target] += estimate_volume(keyword)
+    return groups
+
+def match_keywords(article: dict, keywords: List[str]) -> List[str]:
+    """Returns the keywords that appear as whole words in an article's title or snippet."""
+    if len(keywords) == 1:
+        # A single-keyword query only returns results the search engine matched on it
+        return list(keywords)
+    text = f"{article.get('title', '')} {article.get('snippet', '')}"
+    return [
+        kw for kw in keywords
+        if re.search(rf'(?<!\w){re.escape(kw)}(?!\w)', text, re.IGNORECASE)
+    ]
+
+def merge_results(results_per_query: List[list]) -> List[list]:
+    """
+    Drops results without a link and de-duplicates across queries. A repeated
+    article stays with the first query that returned it and gains the other
+    query's matched keywords.
+    """
+    combined = {}
+    merged = []
+    for results in results_per_query:
+        unique = []
+        for article in results:
+            link = article.get('link')
+            if not link:
+                continue
+            if link in combined:
+                existing = combined[link]
+                existing['matched_keywords'] += [
+                    kw for kw in article['matched_keywords'] if kw not in existing['matched_keywords']
+                ]
+                continue
+            combined[link] = article
+            unique.append(article)
+        merged.append(unique)
+    return merged
+
+def keyword_coverage(results_per_query: List[list], keywords: List[str]) -> dict:
+    """
+    Counts merged results per keyword. Results that matched no keyword in their
+    title or snippet (the keyword was only in the page body) are counted apart,
+    so "no results" and "results we could not attribute" stay distinguishable.
+
+    Returns:
+        A dictionary with 'keywords' (keyword -> count) and 'unattributed' as keys.
+    """
+    counts = {kw: 0 for kw in keywords}
+    unattributed = 0
+    for results in results_per_query:
+        for article in results:
+            if not article['matched_keywords']:
+                unattributed += 1
+            for kw in article['matched_keywords']:
+                counts[kw] += 1
+    return {"keywords": counts, "unattributed": unattributed}
+
+def select_articles(results_per_query: List[list], limit: int) -> list:
+    """
+    Picks up to `limit` articles round-robin across queries, preferring within
+    each query an article that matches a keyword not yet covered by the picks.
+    """
+    queues = [list(results) for results in results_per_query]
+    selected = []
+    covered = set()
+    while len(selected) < limit and any(queues):
+        for queue in queues:
+            if not queue or len(selected) >= limit:
+                continue
+            pick = next((a for a in queue if set(a['matched_keywords']) - covered), queue[0])
+            queue.remove(pick)
+            selected.append(pick)
+            covered.update(pick['matched_keywords'])
+    return selected
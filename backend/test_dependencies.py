@@ -0,0 +1,49 @@
+import importlib
+
+import pytest
+
+pytest.importorskip("dotenv")
+
+from dependencies import Dependencies
+
+SECRETS = ["SERPER_API_KEY", "HF_TOKEN", "OPENAI_API_KEY", "ARCADE_API_KEY", "ARCADE_USER_ID"]
+
+@pytest.fixture
+def no_secrets(monkeypatch):
+    for name in SECRETS:
+        monkeypatch.delenv(name, raising=False)
+    # Keep a local .env file from putting the secrets back
+    monkeypatch.setattr("dotenv.load_dotenv", lambda *args, **kwargs: False)
+
+def test_tools_imports_without_secrets(no_secrets):
+    import tools
+    importlib.reload(tools)
+
+def test_main_imports_without_secrets(no_secrets):
+    pytest.importorskip("fastapi")
+    import main
+    importlib.reload(main)
+
+def test_warm_up_records_missing_secrets(no_secrets):
+    container = Dependencies()
+    container.warm_up()
+    assert container.ready and container.warmup_failed
+
+def test_ready_endpoint_reports_warm_up_state(no_secrets, monkeypatch):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+    import main
+
+    container = Dependencies()
+    monkeypatch.setattr(main, "container", container)
+    # Not entering the client as a context manager skips the lifespan warm-up
+    client = TestClient(main.app)
+
+    response = client.get("/api/ready")
+    assert response.status_code == 503
+    assert response.json() == {"status": "warming"}
+
+    container.warm_up()
+    response = client.get("/api/ready")
+    assert response.status_code == 503
+    assert response.json() == {"status": "error"}
@@ -0,0 +1,101 @@
+import csv
+import os
+import random
+
+from query_planner import (
+    MAX_QUERY_WORDS, _count_words, _first_fit, _fits, build_query, estimate_volume,
+    keyword_coverage, match_keywords, merge_results, plan_queries, select_articles,
+)
+
+KEYWORDS_CSV = os.path.join(os.path.dirname(__file__), "keywords.csv")
+
+def _load_themes() -> dict:
+    themes = {}
+    with open(KEYWORDS_CSV, newline="") as f:
+        for row in csv.DictReader(f):
+            themes.setdefault(row["theme"], []).append(row["keyword"])
+    return themes
+
+def test_suffix_leaves_room_for_keywords():
+    assert _count_words(build_query(["x"])) < MAX_QUERY_WORDS
+
+def test_every_theme_query_fits_the_word_limit():
+    for keywords in _load_themes().values():
+        for plan in plan_queries(keywords):
+            assert _count_words(plan["query"]) <= MAX_QUERY_WORDS
+            assert plan["query"] == build_query(plan["keywords"])
+
+def test_every_keyword_lands_in_exactly_one_group():
+    themes = _load_themes()
+    for keywords in list(themes.values()) + [sum(themes.values(), [])]:
+        planned = [kw for plan in plan_queries(keywords) for kw in plan["keywords"]]
+        assert sorted(planned) == sorted(set(keywords))
+
+def test_theme_needs_fewer_queries_than_keywords():
+    for keywords in _load_themes().values():
+        assert len(plan_queries(keywords)) < len(keywords)
+
+def test_balancing_never_adds_a_query():
+    keywords = ["OOP", "Hadoop", "Infrastructure as Code", "Data Visualization",
+                "Web Assembly", "Data Breach", "Amazon Web Services"]
+    assert len(plan_queries(keywords)) == len(_first_fit(keywords)) == 2
+
+    all_keywords = sum(_load_themes().values(), [])
+    rng = random.Random(0)
+    for _ in range(200):
+        sample = rng.sample(all_keywords, rng.randint(1, len(all_keywords)))
+        assert len(plan_queries(sample)) <= len(_first_fit(sample))
+
+def test_balancing_spreads_broad_keywords():
+    keywords = ["AI", "ML", "DL", "NLP", "Computer Vision", "Neural Network"]
+    plans = plan_queries(keywords)
+    assert len(plans) == 2
+    volumes = [sum(estimate_volume(kw) for kw in plan["keywords"]) for plan in plans]
+    assert max(volumes) - min(volumes) <= 1
+
+def test_duplicates_are_removed_case_insensitively():
+    plans = plan_queries(["AI", "ai", ' "AI" ', "Machine Learning", ""])
+    assert sorted(kw for plan in plans for kw in plan["keywords"]) == ["AI", "Machine Learning"]
+
+def test_empty_selection_plans_nothing():
+    assert plan_queries([]) == []
+
+def test_oversized_keyword_gets_its_own_query():
+    long_keyword = " ".join(["word"] * 20)
+    assert not _fits([long_keyword])
+    plans = plan_queries([long_keyword, "AI", "ML"])
+    assert {"keywords": [long_keyword], "query": build_query([long_keyword])} in plans
+    assert sorted(kw for plan in plans for kw in plan["keywords"]) == sorted([long_keyword, "AI", "ML"])
+
+def test_match_keywords_uses_whole_words():
+    keywords = ["AI", "Node.js", "CI/CD"]
+    assert match_keywords({"title": "Officials said the grant was renewed"}, keywords) == []
+    assert match_keywords({"title": "New ai funding", "snippet": "Node.js and CI/CD labs"}, keywords) == keywords
+    assert match_keywords({"title": "Nodexjs tooling", "snippet": "CI/CDs"}, keywords) == []
+
+def test_single_keyword_query_attributes_every_result():
+    assert match_keywords({"title": "Unrelated title"}, ["Quantum"]) == ["Quantum"]
+
+def test_merge_results_dedupes_and_combines_matches():
+    first = [{"link": "a", "matched_keywords": ["AI"]}, {"matched_keywords": ["ML"]}]
+    second = [{"link": "a", "matched_keywords": ["NLP"]}, {"link": "b", "matched_keywords": ["NLP"]}]
+    merged = merge_results([first, second])
+    assert [[a["link"] for a in results] for results in merged] == [["a"], ["b"]]
+    assert merged[0][0]["matched_keywords"] == ["AI", "NLP"]
+
+def test_keyword_coverage_counts_unattributed_results():
+    results = [
+        [{"link": "a", "matched_keywords": ["AI", "ML"]}, {"link": "b", "matched_keywords": []}],
+        [{"link": "c", "matched_keywords": ["AI"]}],
+    ]
+    assert keyword_coverage(results, ["AI", "ML", "NLP"]) == {
+        "keywords": {"AI": 2, "ML": 1, "NLP": 0},
+        "unattributed": 1,
+    }
+
+def test_select_articles_spreads_picks_across_queries_and_keywords():
+    first = [{"link": f"a{i}", "matched_keywords": ["AI"]} for i in range(9)]
+    first.append({"link": "ml", "matched_keywords": ["ML"]})
+    second = [{"link": f"b{i}", "matched_keywords": ["NLP"]} for i in range(10)]
+    selected = select_articles([first, second], 4)
+    assert [a["link"] for a in selected] == ["a0", "b0", "ml", "b1"]
@@ -1,18 +1,13 @@
 import os
-from arcadepy import Arcade
 from dotenv import load_dotenv
+from dependencies import container
 
 load_dotenv()
 
-# --- Initialize Arcade Client ---
-ARCADE_API_KEY = os.getenv("ARCADE_API_KEY")
+# --- Arcade Configuration ---
+# The Arcade client itself is built lazily by the dependency container.
 USER_ID = os.getenv("ARCADE_USER_ID")
 
-if not all([ARCADE_API_KEY, USER_ID]):
-    raise ValueError("ARCADE_API_KEY and ARCADE_USER_ID must be set in the .env file.")
-
-client = Arcade(api_key=ARCADE_API_KEY)
-
 # --- Tool Definitions ---
 
 def create_document_from_articles(articles: list, keywords: str) -> str:
@@ -41,7 +36,7 @@ def add_content_to_gdoc(content: str, file_name: str = "AI Intelligence Report")
         return "Error: ARCADE_USER_ID is not set in the .env file."
     print(f"TOOL CALLED: Creating Google Doc titled '{file_name}'...")
     try:
-        result = client.tools.execute(
+        result = container.arcade.tools.execute(
             tool_name="GoogleDocs.CreateDocumentFromText@4.0.0",
             input={"title": file_name, "text_content": content},
             user_id=USER_ID,
@@ -65,7 +60,7 @@ def send_email(email_body: str, subject: str, recipient: str):
     """Sends an email with the provided content as the body."""
     print(f"📧 Calling Arcade to send email to {recipient}...")
     try:
-        result = client.tools.execute(
+        result = container.arcade.tools.execute(
             tool_name="Gmail.SendEmail@3.0.0",
             input={"body": email_body, "subject": subject, "recipient": recipient},
             user_id=USER_ID,